@@ -0,0 +1,104 @@
+import os
+import random
+import subprocess
+import sys
+import time
+
+from fileuas import DoublyLinkedList, Song
+
+
+# ==================== DATA SINTETIS ====================
+def build_playlist(n, seed=42):
+    """Membuat playlist sintetis berisi n lagu"""
+    rng = random.Random(seed)
+    genres = ['Pop', 'Rock', 'Jazz', 'K-Pop', 'Dangdut']
+    playlist = DoublyLinkedList()
+
+    for i in range(n):
+        playlist.insert_last(Song(
+            id=str(i),
+            title=f"Song {i}",
+            artist=f"Artist {rng.randint(1, n // 20 or 1)}",
+            album=f"Album {i // 10}",
+            genre=rng.choice(genres),
+            duration=rng.randint(120, 420),
+            year=rng.randint(1970, 2024),
+            rating=round(rng.uniform(3.0, 5.0), 1)
+        ))
+
+    return playlist
+
+
+# ==================== BENCHMARK ====================
+def bench_timed_playlist(n=100_000, repeat=5):
+    """
+    Benchmark generate_timed_playlist untuk slot 60 menit
+    Tanpa filter genre/rating, jadi semua n lagu menjadi kandidat
+    """
+    playlist = build_playlist(n)
+
+    for max_per_artist in (None, 2, 5):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = playlist.generate_timed_playlist(3600, tolerance=0,
+                                                      max_per_artist=max_per_artist)
+            timings.append(time.perf_counter() - start)
+
+        print(f"generate_timed_playlist ({n} kandidat, max_per_artist={max_per_artist}): "
+              f"best {min(timings) * 1000:.1f} ms, "
+              f"hasil {result.size if result else 0} lagu / "
+              f"{result.get_total_duration() if result else 0} detik")
+
+
+def write_dataset(filename, n, seed=42):
+    """Menulis dataset CSV sintetis berisi n baris (format sama dengan datasetuas.csv)"""
+    import csv
+
+    rng = random.Random(seed)
+    genres = ['Pop', 'Rock', 'Jazz', 'K-Pop', 'Dangdut']
+    with open(filename, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['ID', 'Title', 'Artist', 'Album', 'Genre', 'Duration', 'Year', 'Rating'])
+        for i in range(n):
+            duration = rng.randint(120, 420)
+            writer.writerow([i, f"Song {i}", f"Artist {rng.randint(1, n // 20 or 1)}",
+                             f"Album {i // 10}", rng.choice(genres),
+                             f"{duration // 60}:{duration % 60:02d}",
+                             rng.randint(1970, 2024), round(rng.uniform(3.0, 5.0), 1)])
+
+
+def bench_startup(n=200_000, repeat=3):
+    """
+    Benchmark startup CLI `stats` (streaming, import lazy) dibanding jalur
+    interaktif lama: import csv/random/datetime di awal lalu load_from_csv
+    seluruh file sebelum menu tampil
+    """
+    import tempfile
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as tmp:
+        dataset = os.path.join(tmp, "dataset.csv")
+        write_dataset(dataset, n)
+
+        # Keduanya lewat import agar sama-sama memakai bytecode cache
+        commands = {
+            'cli stats': [sys.executable, '-c',
+                          f"import fileuas; fileuas.main(['stats', '--file', {dataset!r}])"],
+            'interactive load': [sys.executable, '-c',
+                                 "import csv, random; from datetime import datetime; "
+                                 f"import fileuas; fileuas.load_from_csv({dataset!r})"],
+        }
+
+        for name, command in commands.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                subprocess.run(command, cwd=here, stdout=subprocess.DEVNULL, check=True)
+                timings.append(time.perf_counter() - start)
+            print(f"startup {name} ({n} baris): best {min(timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    bench_timed_playlist()
+    bench_startup()
@@ -1,6 +1,11 @@
-import csv
-import random
-from datetime import datetime
+import heapq
+import unicodedata
+from array import array
+from collections import OrderedDict, deque
+from operator import attrgetter
+
+# csv, random dan datetime di-import di dalam fungsi yang memakainya
+# agar CLI non-interaktif bisa start tanpa memuat modul yang tidak perlu
 
 # ==================== CLASS SONG ====================
 class Song:
@@ -29,6 +34,10 @@ class Node:
 
 
 # ==================== CLASS DOUBLY LINKED LIST ====================
+# Atribut Song yang menentukan hasil search/filter_by_genre/filter_by_year
+CACHED_FIELDS = frozenset(('title', 'artist', 'genre', 'year'))
+
+
 class DoublyLinkedList:
     """Class Doubly Linked List untuk Playlist Musik"""
     
@@ -37,6 +46,123 @@ class DoublyLinkedList:
         self.tail = None
         self.size = 0
         self.current_song = None
+        
+        # Cache hasil search/filter (LRU), di-invalidate lewat version
+        self.version = 0
+        self.cache_capacity = 128
+        self._cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    # ========== CACHE FUNCTIONS ==========
+    def _cache_get(self, key):
+        """
+        Mengambil hasil dari cache dan menandainya sebagai paling baru dipakai
+        Input: key (tuple jenis query dan query ternormalisasi)
+        Output: List of Song objects (salinan) atau None
+        Kompleksitas: O(r), r = jumlah hasil
+        """
+        results = self._cache.get(key)
+        if results is None:
+            self.cache_misses += 1
+            return None
+        
+        self._cache.move_to_end(key)
+        self.cache_hits += 1
+        return list(results)
+    
+    def _cache_put(self, key, results):
+        """
+        Menyimpan hasil ke cache, membuang entry paling lama jika penuh
+        Input: key (tuple), results (List of Song objects)
+        Output: -
+        Kompleksitas: O(r)
+        """
+        if self.cache_capacity <= 0:
+            return
+        
+        # deque agar tambal di awal/akhir (insert/delete first/last) O(1)
+        self._cache[key] = deque(results)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_capacity:
+            self._cache.popitem(last=False)
+    
+    @staticmethod
+    def _cache_matches(key, song):
+        """Mengecek apakah lagu termasuk hasil dari query cache tertentu"""
+        kind, query = key
+        if kind == 'search':
+            return (query in song.title.lower() or
+                    query in song.artist.lower() or
+                    query in song.genre.lower())
+        if kind == 'genre':
+            return song.genre.lower() == query
+        if kind == 'year':
+            return song.year == query
+        return False
+    
+    def _cache_on_insert(self, song, at_end):
+        """
+        Menambal cache secara incremental setelah insert di awal/akhir
+        Input: song (Song object), at_end (Boolean)
+        Output: -
+        Kompleksitas: O(c), c = jumlah entry cache
+        """
+        self.version += 1
+        for key, results in self._cache.items():
+            if self._cache_matches(key, song):
+                if at_end:
+                    results.append(song)
+                else:
+                    results.appendleft(song)
+    
+    def _cache_on_delete(self, song):
+        """
+        Menambal cache secara incremental setelah lagu dihapus
+        Input: song (Song object yang dihapus)
+        Output: -
+        Kompleksitas: O(c) untuk head/tail, O(c * r) untuk node di tengah
+        """
+        self.version += 1
+        for key, results in self._cache.items():
+            if not self._cache_matches(key, song):
+                continue
+            # Hasil cache urut sesuai playlist, jadi head/tail ada di ujung
+            if results and results[0] is song:
+                results.popleft()
+            elif results and results[-1] is song:
+                results.pop()
+            else:
+                for i, cached in enumerate(results):
+                    if cached is song:
+                        del results[i]
+                        break
+    
+    def invalidate_cache(self):
+        """
+        Mengosongkan cache karena perubahan yang tidak bisa ditambal
+        (insert_after, update title/artist/genre/year, shuffle, sort)
+        Input: -
+        Output: -
+        Kompleksitas: O(1)
+        """
+        self.version += 1
+        self._cache.clear()
+    
+    def cache_info(self):
+        """
+        Statistik cache untuk menentukan ukuran cache
+        Input: -
+        Output: Dictionary (hits, misses, size, capacity, version)
+        Kompleksitas: O(1)
+        """
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'size': len(self._cache),
+            'capacity': self.cache_capacity,
+            'version': self.version,
+        }
     
     # ========== INSERT FUNCTIONS ==========
     def insert_first(self, song):
@@ -57,6 +183,7 @@ class DoublyLinkedList:
             self.head = new_node
         
         self.size += 1
+        self._cache_on_insert(song, at_end=False)
         return True
     
     def insert_last(self, song):
@@ -66,7 +193,16 @@ class DoublyLinkedList:
         Output: Boolean (True jika berhasil)
         Kompleksitas: O(1)
         """
-        new_node = Node(song)
+        return self._append_node(Node(song))
+    
+    def _append_node(self, new_node):
+        """
+        Menyambungkan node yang sudah ada di akhir playlist (tanpa alokasi baru)
+        Input: Node object yang tidak terhubung ke playlist lain
+        Output: Boolean (True jika berhasil)
+        Kompleksitas: O(1)
+        """
+        new_node.prev = new_node.next = None
         
         if not self.tail:  # Jika playlist kosong
             self.head = self.tail = new_node
@@ -77,6 +213,7 @@ class DoublyLinkedList:
             self.tail = new_node
         
         self.size += 1
+        self._cache_on_insert(new_node.song, at_end=True)
         return True
     
     def insert_after(self, target_id, song):
@@ -101,6 +238,7 @@ class DoublyLinkedList:
                 
                 current.next = new_node
                 self.size += 1
+                self.invalidate_cache()
                 return True
             
             current = current.next
@@ -131,6 +269,7 @@ class DoublyLinkedList:
             self.head.prev = None
         
         self.size -= 1
+        self._cache_on_delete(deleted)
         return deleted
     
     def delete_last(self):
@@ -156,6 +295,7 @@ class DoublyLinkedList:
             self.tail.next = None
         
         self.size -= 1
+        self._cache_on_delete(deleted)
         return deleted
     
     def delete_node(self, id):
@@ -185,12 +325,38 @@ class DoublyLinkedList:
                     current.prev.next = current.next
                     current.next.prev = current.prev
                     self.size -= 1
+                    self._cache_on_delete(current.song)
                     return current.song
             
             current = current.next
         
         return None
     
+    def _unlink_node(self, node):
+        """
+        Melepas node tertentu dari playlist tanpa mencari
+        Input: Node object (harus milik playlist ini)
+        Output: Song object yang dilepas
+        Kompleksitas: O(1)
+        """
+        if self.current_song == node:
+            self.current_song = node.next or node.prev
+        
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        
+        node.prev = node.next = None
+        self.size -= 1
+        self._cache_on_delete(node.song)
+        return node.song
+    
     # ========== DISPLAY FUNCTIONS ==========
     def display_forward(self):
         """
@@ -230,11 +396,16 @@ class DoublyLinkedList:
         Mencari lagu berdasarkan judul, artis, atau genre
         Input: query (String)
         Output: List of Song objects yang cocok
-        Kompleksitas: O(n)
+        Kompleksitas: O(n), O(r) jika hasil ada di cache
         """
+        query_lower = query.lower()
+        key = ('search', query_lower)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         results = []
         current = self.head
-        query_lower = query.lower()
         
         while current:
             song = current.song
@@ -245,6 +416,7 @@ class DoublyLinkedList:
             
             current = current.next
         
+        self._cache_put(key, results)
         return results
     
     def update(self, id, **kwargs):
@@ -261,6 +433,12 @@ class DoublyLinkedList:
                 for key, value in kwargs.items():
                     if hasattr(current.song, key):
                         setattr(current.song, key, value)
+                
+                # Hanya atribut yang dipakai search/filter yang mengubah hasil cache
+                if CACHED_FIELDS.intersection(kwargs):
+                    self.invalidate_cache()
+                else:
+                    self.version += 1
                 return True
             
             current = current.next
@@ -275,10 +453,13 @@ class DoublyLinkedList:
         Output: Boolean (True jika berhasil)
         Kompleksitas: O(n)
         """
+        import random
+        
         songs = self.display_forward()
         random.shuffle(songs)
         
         # Rebuild playlist
+        self.invalidate_cache()
         self.head = self.tail = None
         self.current_song = None
         self.size = 0
@@ -342,16 +523,23 @@ class DoublyLinkedList:
         Filter lagu berdasarkan genre
         Input: genre (String)
         Output: List of Song objects
-        Kompleksitas: O(n)
+        Kompleksitas: O(n), O(r) jika hasil ada di cache
         """
+        genre_lower = genre.lower()
+        key = ('genre', genre_lower)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         results = []
         current = self.head
         
         while current:
-            if current.song.genre.lower() == genre.lower():
+            if current.song.genre.lower() == genre_lower:
                 results.append(current.song)
             current = current.next
         
+        self._cache_put(key, results)
         return results
     
     def filter_by_year(self, year):
@@ -359,8 +547,13 @@ class DoublyLinkedList:
         Filter lagu berdasarkan tahun
         Input: year (Integer)
         Output: List of Song objects
-        Kompleksitas: O(n)
+        Kompleksitas: O(n), O(r) jika hasil ada di cache
         """
+        key = ('year', year)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         results = []
         current = self.head
         
@@ -369,6 +562,7 @@ class DoublyLinkedList:
                 results.append(current.song)
             current = current.next
         
+        self._cache_put(key, results)
         return results
     
     def sort_by_title(self):
@@ -382,6 +576,7 @@ class DoublyLinkedList:
         songs.sort(key=lambda x: x.title.lower())
         
         # Rebuild playlist
+        self.invalidate_cache()
         self.head = self.tail = None
         self.current_song = None
         self.size = 0
@@ -402,6 +597,7 @@ class DoublyLinkedList:
         songs.sort(key=lambda x: x.artist.lower())
         
         # Rebuild playlist
+        self.invalidate_cache()
         self.head = self.tail = None
         self.current_song = None
         self.size = 0
@@ -410,6 +606,581 @@ class DoublyLinkedList:
             self.insert_last(song)
         
         return True
+    
+    def deduplicate(self, keep='rating'):
+        """
+        Menggabungkan lagu duplikat (judul dan artis sama setelah normalisasi)
+        Input: keep (aturan pemenang: 'rating', 'first', 'last', 'year' atau callable)
+        Output: Integer (jumlah lagu yang dihapus)
+        Kompleksitas: O(n)
+        """
+        validate_keep(keep)
+        winners = {}
+        current = self.head
+        
+        while current:
+            key = song_key(current.song)
+            existing = winners.get(key)
+            winners[key] = (current.song if existing is None
+                            else pick_song(existing, current.song, keep))
+            current = current.next
+        
+        if len(winners) == self.size:
+            return 0
+        
+        # Cache dikosongkan dulu agar _unlink_node tidak menambal cache per node
+        self.invalidate_cache()
+        
+        # Lagu pemenang menempati posisi kemunculan pertama
+        removed = 0
+        seen = set()
+        current = self.head
+        
+        while current:
+            next_node = current.next
+            key = song_key(current.song)
+            if key in seen:
+                self._unlink_node(current)
+                removed += 1
+            else:
+                seen.add(key)
+                current.song = winners[key]
+            current = next_node
+        
+        return removed
+    
+    # ========== SET OPERATIONS ==========
+    def _iter_nodes(self):
+        """Iterasi node dari head; aman jika node yang sedang di-yield dilepas"""
+        current = self.head
+        while current:
+            next_node = current.next
+            yield current
+            current = next_node
+    
+    def _build(self, other, items, splice):
+        """
+        Membangun playlist baru dari pasangan (playlist asal, node)
+        Jika splice=True, node dipindahkan dari playlist asal (tanpa copy)
+        """
+        if splice:
+            # Cache asal dikosongkan sekali, bukan ditambal per node
+            self.invalidate_cache()
+            other.invalidate_cache()
+            # Pilih semua node dulu sebelum relink, agar iterasi tidak ikut
+            # berjalan di node yang sudah dipindah (mis. a.merge(a))
+            items = list(items)
+        
+        result = DoublyLinkedList()
+        for owner, node in items:
+            if splice:
+                owner._unlink_node(node)
+                result._append_node(node)
+            else:
+                result.insert_last(node.song)
+        return result
+    
+    def union(self, other, splice=False):
+        """
+        Gabungan lagu dari playlist ini lalu lagu dari other yang belum ada
+        Input: other (DoublyLinkedList), splice (Boolean, pindahkan node alih-alih copy)
+        Output: DoublyLinkedList baru
+        Kompleksitas: O(n + m)
+        """
+        def items():
+            seen = set()
+            for owner in (self, other):
+                for node in owner._iter_nodes():
+                    if node.song.id not in seen:
+                        seen.add(node.song.id)
+                        yield owner, node
+        
+        return self._build(other, items(), splice)
+    
+    def intersection(self, other, splice=False):
+        """
+        Lagu dari playlist ini yang ID-nya juga ada di other
+        Input: other (DoublyLinkedList), splice (Boolean)
+        Output: DoublyLinkedList baru (urutan mengikuti playlist ini)
+        Kompleksitas: O(n + m)
+        """
+        other_ids = {node.song.id for node in other._iter_nodes()}
+        
+        def items():
+            seen = set()
+            for node in self._iter_nodes():
+                if node.song.id in other_ids and node.song.id not in seen:
+                    seen.add(node.song.id)
+                    yield self, node
+        
+        return self._build(other, items(), splice)
+    
+    def difference(self, other, splice=False):
+        """
+        Lagu dari playlist ini yang ID-nya tidak ada di other
+        Input: other (DoublyLinkedList), splice (Boolean)
+        Output: DoublyLinkedList baru (urutan mengikuti playlist ini)
+        Kompleksitas: O(n + m)
+        """
+        other_ids = {node.song.id for node in other._iter_nodes()}
+        
+        def items():
+            seen = set()
+            for node in self._iter_nodes():
+                if node.song.id not in other_ids and node.song.id not in seen:
+                    seen.add(node.song.id)
+                    yield self, node
+        
+        return self._build(other, items(), splice)
+    
+    def merge(self, other, splice=False):
+        """
+        Menggabungkan dua antrian secara bergantian (A1, B1, A2, B2, ...)
+        dengan tetap menjaga urutan masing-masing dan melewati ID duplikat
+        Input: other (DoublyLinkedList), splice (Boolean)
+        Output: DoublyLinkedList baru
+        Kompleksitas: O(n + m)
+        """
+        def items():
+            seen = set()
+            sources = [(self, self._iter_nodes()), (other, other._iter_nodes())]
+            while sources:
+                for source in list(sources):
+                    owner, nodes = source
+                    node = next(nodes, None)
+                    while node and node.song.id in seen:
+                        node = next(nodes, None)
+                    if node is None:
+                        sources.remove(source)
+                        continue
+                    seen.add(node.song.id)
+                    yield owner, node
+        
+        return self._build(other, items(), splice)
+    
+    # ========== PLAYLIST GENERATOR ==========
+    def generate_timed_playlist(self, target, tolerance=30, genre=None,
+                                min_rating=None, max_per_artist=None):
+        """
+        Membuat playlist baru dengan total durasi mendekati target (slot radio)
+        Input: target (Integer, detik), tolerance (Integer, detik),
+               genre (String), min_rating (Float), max_per_artist (Integer)
+        Output: DoublyLinkedList baru atau None jika target tidak bisa dicapai
+        Kompleksitas: O(n + P log P + B log(T) * T / w), P = kandidat setelah
+                      pruning per durasi (tidak bergantung n), B = jumlah durasi
+                      berbeda, T = target + tolerance, w = ukuran word
+        """
+        if (not isinstance(target, int) or not isinstance(tolerance, int)
+                or target < 0 or tolerance < 0):
+            raise ValueError("target dan tolerance harus integer >= 0 (detik)")
+        if max_per_artist is not None and max_per_artist < 1:
+            raise ValueError("max_per_artist minimal 1")
+        
+        limit = target + tolerance
+        genre_lower = genre.lower() if genre else None
+        
+        # Kandidat langsung dikelompokkan per durasi, tanpa objek baru per lagu
+        buckets = {}
+        current = self.head
+        while current:
+            song = current.song
+            current = current.next
+            if genre_lower and song.genre.lower() != genre_lower:
+                continue
+            if min_rating is not None and song.rating < min_rating:
+                continue
+            bucket = buckets.get(song.duration)
+            if bucket is None:
+                buckets[song.duration] = [song]
+            else:
+                bucket.append(song)
+        
+        for duration in buckets:
+            if not isinstance(duration, int) or isinstance(duration, bool):
+                raise ValueError(f"Durasi lagu harus integer (detik), bukan {duration!r}")
+        buckets = {duration: bucket for duration, bucket in buckets.items()
+                   if 0 < duration <= limit}
+        
+        if max_per_artist is None:
+            # Tiap durasi cukup limit // durasi lagu dengan rating tertinggi
+            pool = {duration: sorted(bucket, key=attrgetter('rating'),
+                                     reverse=True)[:limit // duration]
+                    for duration, bucket in buckets.items()}
+            counts = self._timed_counts(pool, target, tolerance)
+            chosen = None if counts is None else [
+                song for duration, count in counts.items()
+                for song in pool[duration][:count]]
+        else:
+            pool = self._artist_pool(buckets, limit, max_per_artist)
+            counts = self._timed_counts(pool, target, tolerance)
+            chosen = None
+            if counts is not None:
+                chosen = self._repair_artist_cap(pool, counts, max_per_artist)
+                if chosen is None:
+                    chosen = self._timed_by_artist(pool, target, tolerance,
+                                                   max_per_artist)
+        
+        if chosen is None:
+            return None
+        
+        # Hasil mengikuti urutan playlist asal
+        remaining = {}
+        for song in chosen:
+            remaining[id(song)] = remaining.get(id(song), 0) + 1
+        
+        result = DoublyLinkedList()
+        current = self.head
+        while current and result.size < len(chosen):
+            song = current.song
+            if remaining.get(id(song)):
+                remaining[id(song)] -= 1
+                result.insert_last(song)
+            current = current.next
+        return result
+    
+    @staticmethod
+    def _closest_reachable(reachable, target, tolerance):
+        """Durasi tercapai (bit bernilai 1) yang paling dekat dengan target"""
+        for offset in range(tolerance + 1):
+            for total in (target - offset, target + offset):
+                if total > 0 and (reachable >> total) & 1:
+                    return total
+        return None
+    
+    @staticmethod
+    def _timed_counts(pool, target, tolerance):
+        """
+        Bounded subset-sum dengan bitset (bit ke-s = durasi s bisa dicapai)
+        atas bucket durasi; jumlah lagu per bucket dipecah biner (1, 2, 4, ...)
+        Output: Dictionary durasi -> jumlah lagu yang dipakai, atau None
+        """
+        mask = (1 << (target + tolerance + 1)) - 1
+        reachable = 1
+        states = []
+        steps = []
+        for duration, bucket in pool.items():
+            remaining = len(bucket)
+            chunk = 1
+            while remaining > 0:
+                take = min(chunk, remaining)
+                states.append(reachable)
+                steps.append((duration, take))
+                reachable = (reachable | (reachable << (duration * take))) & mask
+                remaining -= take
+                chunk *= 2
+        
+        total = DoublyLinkedList._closest_reachable(reachable, target, tolerance)
+        if total is None:
+            return None
+        
+        # Backtrack langkah DP untuk mengetahui jumlah lagu per bucket
+        counts = {}
+        for i in range(len(steps) - 1, -1, -1):
+            if (states[i] >> total) & 1:
+                continue
+            duration, take = steps[i]
+            counts[duration] = counts.get(duration, 0) + take
+            total -= duration * take
+        return counts
+    
+    @staticmethod
+    def _artist_pool(buckets, limit, max_per_artist):
+        """
+        Pruning kandidat per durasi untuk batas lagu per artis
+        Tiap durasi d menyimpan maksimal K = limit // d + limit // (d_min * c) + 1
+        artis berbeda (c = max_per_artist), masing-masing maksimal
+        min(c, limit // d) lagu. Dengan K artis, lagu yang dibuang selalu bisa
+        ditukar dengan lagu berdurasi sama milik artis yang masih punya kuota,
+        jadi durasi yang bisa dicapai tidak berubah; karena itu scan bucket
+        berhenti begitu K artis terkumpul.
+        Urutan bucket: lagu pertama tiap artis dulu (rating tertinggi), lalu
+        lagu kedua, dst., agar DP cepat jarang melanggar batas artis.
+        """
+        if not buckets:
+            return {}
+        
+        spare_artists = limit // (min(buckets) * max_per_artist) + 1
+        pool = {}
+        for duration, bucket in buckets.items():
+            per_artist_limit = min(max_per_artist, limit // duration)
+            max_artists = limit // duration + spare_artists
+            bucket.sort(key=attrgetter('rating'), reverse=True)
+            
+            kept = {}
+            rounds = [[] for _ in range(per_artist_limit)]
+            for song in bucket:
+                artist = song.artist.lower()
+                used = kept.get(artist)
+                if used is None:
+                    if len(kept) == max_artists:
+                        break
+                    used = 0
+                elif used == per_artist_limit:
+                    continue
+                kept[artist] = used + 1
+                rounds[used].append(song)
+            pool[duration] = [song for songs in rounds for song in songs]
+        return pool
+    
+    @staticmethod
+    def _repair_artist_cap(pool, counts, max_per_artist):
+        """
+        Memperbaiki hasil DP tanpa batas artis dengan menukar lagu artis yang
+        melebihi batas dengan lagu berdurasi sama dari artis lain
+        Output: List of Song objects atau None jika tidak bisa diperbaiki
+        """
+        chosen = {duration: pool[duration][:count] for duration, count in counts.items()}
+        spare = {duration: pool[duration][count:] for duration, count in counts.items()}
+        
+        per_artist = {}
+        for songs in chosen.values():
+            for song in songs:
+                artist = song.artist.lower()
+                per_artist[artist] = per_artist.get(artist, 0) + 1
+        
+        for duration, songs in chosen.items():
+            for i, song in enumerate(songs):
+                artist = song.artist.lower()
+                if per_artist[artist] <= max_per_artist:
+                    continue
+                for j, other in enumerate(spare[duration]):
+                    other_artist = other.artist.lower()
+                    if per_artist.get(other_artist, 0) < max_per_artist:
+                        songs[i], spare[duration][j] = other, song
+                        per_artist[artist] -= 1
+                        per_artist[other_artist] = per_artist.get(other_artist, 0) + 1
+                        break
+        
+        if any(count > max_per_artist for count in per_artist.values()):
+            return None
+        return [song for songs in chosen.values() for song in songs]
+    
+    @staticmethod
+    def _timed_by_artist(pool, target, tolerance, max_per_artist):
+        """
+        Subset-sum eksak dengan batas lagu per artis: tiap artis diproses sebagai
+        grup dengan layer bitset per jumlah lagu yang dipakai (0..max_per_artist)
+        Dipakai jika _repair_artist_cap gagal.
+        Output: List of Song objects atau None
+        """
+        groups = {}
+        for bucket in pool.values():
+            for song in bucket:
+                groups.setdefault(song.artist.lower(), []).append(song)
+        groups = [sorted(group, key=attrgetter('rating'), reverse=True)
+                  for group in groups.values()]
+        
+        mask = (1 << (target + tolerance + 1)) - 1
+        
+        def run_group(start, group, snapshots=None):
+            # layers[j] = durasi yang bisa dicapai dengan j lagu dari grup ini
+            layers = [start] + [0] * max_per_artist
+            for song in group:
+                if snapshots is not None:
+                    snapshots.append(list(layers))
+                for j in range(max_per_artist, 0, -1):
+                    if layers[j - 1]:
+                        layers[j] |= (layers[j - 1] << song.duration) & mask
+            return layers
+        
+        reachable = 1
+        states = []
+        for group in groups:
+            states.append(reachable)
+            for layer in run_group(reachable, group):
+                reachable |= layer
+        
+        total = DoublyLinkedList._closest_reachable(reachable, target, tolerance)
+        if total is None:
+            return None
+        
+        chosen = []
+        for i in range(len(groups) - 1, -1, -1):
+            if (states[i] >> total) & 1:
+                continue
+            
+            # Ulangi DP grup ini dengan snapshot untuk backtrack
+            group = groups[i]
+            snapshots = []
+            layers = run_group(states[i], group, snapshots)
+            count = next(j for j in range(1, max_per_artist + 1)
+                         if (layers[j] >> total) & 1)
+            for k in range(len(group) - 1, -1, -1):
+                if count == 0:
+                    break
+                if (snapshots[k][count] >> total) & 1:
+                    continue
+                chosen.append(group[k])
+                total -= group[k].duration
+                count -= 1
+        return chosen
+
+
+# ==================== CLASS LISTENING SESSION ====================
+class ListeningSession:
+    """Class untuk mencatat riwayat putar dengan memori tetap"""
+    
+    def __init__(self, playlist, history_size=100):
+        if history_size < 1:
+            raise ValueError("history_size minimal 1")
+        
+        self.playlist = playlist
+        self.history_size = history_size
+        
+        # Ring buffer riwayat putar (berisi ID lagu)
+        self._history = [None] * history_size
+        self._history_pos = 0
+        self.history_count = 0
+        
+        # Counter putar: ID lagu -> slot di array
+        self._slot_of = {}
+        self.play_counts = array('L')
+        
+        # Waktu putar simulasi (detik), position relatif terhadap _playing
+        self.elapsed = 0
+        self.position = 0
+        self._playing = None
+        
+        self._sync()
+    
+    def _record_play(self, song):
+        """
+        Mencatat satu kali putar ke riwayat dan counter
+        Input: Song object
+        Output: -
+        Kompleksitas: O(1)
+        """
+        self._history[self._history_pos] = song.id
+        self._history_pos = (self._history_pos + 1) % self.history_size
+        if self.history_count < self.history_size:
+            self.history_count += 1
+        
+        slot = self._slot_of.get(song.id)
+        if slot is None:
+            slot = len(self.play_counts)
+            self._slot_of[song.id] = slot
+            self.play_counts.append(0)
+        self.play_counts[slot] += 1
+        self._playing = song
+        self.position = 0
+    
+    def _sync(self):
+        """
+        Menyesuaikan sesi jika lagu yang sedang diputar diganti langsung lewat
+        playlist (delete_node, shuffle, sort, deduplicate, ...)
+        Input: -
+        Output: Song object yang sedang diputar atau None
+        Kompleksitas: O(1)
+        """
+        song = self.playlist.get_current_song()
+        if song is not self._playing:
+            if song:
+                self._record_play(song)
+            else:
+                self._playing = None
+                self.position = 0
+        return song
+    
+    def play_next(self):
+        """
+        Memutar lagu berikutnya dan mencatatnya ke riwayat
+        Input: -
+        Output: Song object atau None
+        Kompleksitas: O(1)
+        """
+        song = self.playlist.play_next()
+        if song:
+            self._record_play(song)
+        return song
+    
+    def play_previous(self):
+        """
+        Memutar lagu sebelumnya dan mencatatnya ke riwayat
+        Input: -
+        Output: Song object atau None
+        Kompleksitas: O(1)
+        """
+        song = self.playlist.play_previous()
+        if song:
+            self._record_play(song)
+        return song
+    
+    def get_current_song(self):
+        """
+        Mendapatkan lagu yang sedang diputar (sekaligus sinkron dengan playlist)
+        Input: -
+        Output: Song object atau None
+        Kompleksitas: O(1)
+        """
+        return self._sync()
+    
+    def advance(self, seconds):
+        """
+        Mensimulasikan pemutaran selama beberapa detik berdasarkan Song.duration,
+        otomatis lanjut ke lagu berikutnya jika lagu selesai
+        Input: seconds (Integer)
+        Output: Song object yang sedang diputar atau None jika playlist habis
+        Kompleksitas: O(jumlah lagu yang terlewati)
+        """
+        song = self.get_current_song()
+        
+        while song and seconds > 0:
+            remaining = song.duration - self.position
+            if seconds < remaining:
+                self.position += seconds
+                self.elapsed += seconds
+                return song
+            
+            seconds -= remaining
+            self.elapsed += remaining
+            self.position = song.duration
+            song = self.play_next()
+        
+        return song
+    
+    def resume_point(self):
+        """
+        Mendapatkan posisi terakhir untuk melanjutkan pemutaran
+        Input: -
+        Output: Tuple (Song object, posisi dalam detik) atau None
+        Kompleksitas: O(1)
+        """
+        song = self.get_current_song()
+        return (song, self.position) if song else None
+    
+    def get_play_count(self, id):
+        """
+        Mendapatkan jumlah putar sebuah lagu
+        Input: id (String)
+        Output: Integer
+        Kompleksitas: O(1)
+        """
+        slot = self._slot_of.get(id)
+        return self.play_counts[slot] if slot is not None else 0
+    
+    def recently_played(self, n=10):
+        """
+        Mendapatkan ID lagu yang terakhir diputar (terbaru di depan)
+        Input: n (Integer, maksimal history_size)
+        Output: List of ID lagu
+        Kompleksitas: O(n)
+        """
+        n = min(n, self.history_count)
+        return [self._history[(self._history_pos - i) % self.history_size]
+                for i in range(1, n + 1)]
+    
+    def most_played_recent(self, n, k=5):
+        """
+        Mendapatkan k lagu paling sering diputar dalam n putaran terakhir
+        Input: n (Integer, maksimal history_size), k (Integer)
+        Output: List of tuple (ID lagu, jumlah putar)
+        Kompleksitas: O(n + m log k), m = jumlah lagu berbeda dalam n putaran
+        """
+        counts = {}
+        for id in self.recently_played(n):
+            counts[id] = counts.get(id, 0) + 1
+        
+        return heapq.nlargest(k, counts.items(), key=lambda item: item[1])
 
 
 # ==================== UTILITY FUNCTIONS ====================
@@ -426,6 +1197,64 @@ def parse_duration(duration_str):
         return 180
 
 
+def normalize_text(text):
+    """Normalisasi teks untuk deteksi duplikat (huruf kecil, tanpa aksen dan tanda baca)"""
+    text = unicodedata.normalize('NFKD', text)
+    # Tanda aksen dibuang, tanda baca diganti spasi ("Hati-Hati" == "hati hati")
+    chars = [c if c.isalnum() else ' '
+             for c in text.lower() if not unicodedata.combining(c)]
+    return ' '.join(''.join(chars).split())
+
+
+def song_key(song):
+    """Kunci bucket duplikat: (judul, artis) yang sudah dinormalisasi"""
+    return (normalize_text(song.title), normalize_text(song.artist))
+
+
+KEEP_RULES = ('rating', 'year', 'first', 'last')
+
+
+def validate_keep(keep):
+    """Memastikan aturan keep dikenal sebelum proses dedup dimulai"""
+    if not callable(keep) and keep not in KEEP_RULES:
+        raise ValueError(f"Aturan keep tidak dikenal: {keep}")
+
+
+def pick_song(existing, candidate, keep='rating'):
+    """
+    Memilih lagu yang dipertahankan dari dua lagu duplikat
+    Input: existing, candidate (Song object), keep ('rating', 'first', 'last', 'year' atau callable)
+    Output: Song object pemenang
+    """
+    if callable(keep):
+        return keep(existing, candidate)
+    if keep == 'rating':
+        return candidate if candidate.rating > existing.rating else existing
+    if keep == 'year':
+        return candidate if candidate.year > existing.year else existing
+    if keep == 'first':
+        return existing
+    if keep == 'last':
+        return candidate
+    raise ValueError(f"Aturan keep tidak dikenal: {keep}")
+
+
+def deduplicate_songs(songs, keep='rating'):
+    """
+    Menggabungkan lagu duplikat dengan hashing ke bucket (judul, artis)
+    Input: iterable of Song objects, keep (aturan pemenang)
+    Output: List of Song objects unik, urut sesuai kemunculan pertama
+    Kompleksitas: O(n)
+    """
+    validate_keep(keep)
+    winners = {}
+    for song in songs:
+        key = song_key(song)
+        existing = winners.get(key)
+        winners[key] = song if existing is None else pick_song(existing, song, keep)
+    return list(winners.values())
+
+
 def convert_txt_to_csv(input_file="DATASETUAS.txt", output_file="DATASETUAS.csv"):
     """
     Mengkonversi file TXT ke CSV
@@ -445,9 +1274,58 @@ def convert_txt_to_csv(input_file="DATASETUAS.txt", output_file="DATASETUAS.csv"
         return False
 
 
-def load_from_csv(filename):
-    """Memuat playlist dari file CSV/TXT"""
+def song_from_row(row):
+    """Membuat Song object dari satu baris CSV (dictionary kolom -> nilai)"""
+    return Song(
+        id=str(row['ID']),
+        title=row['Title'],
+        artist=row['Artist'],
+        album=row['Album'],
+        genre=row['Genre'],
+        duration=parse_duration(row['Duration']),  # MM:SS ke detik
+        year=int(row['Year']),
+        rating=float(row['Rating'])
+    )
+
+
+def iter_csv_rows(filename, columns=None):
+    """
+    Membaca file CSV/TXT secara streaming tanpa membangun playlist
+    Input: filename, columns (list nama kolom yang dibutuhkan, None = semua)
+    Output: generator tuple (nomor baris data, dictionary kolom -> nilai)
+    Kompleksitas: O(n) waktu, O(1) memori
+    """
+    import csv
+    
+    with open(filename, 'r', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        names = columns or header
+        missing = [name for name in names if name not in header]
+        if missing:
+            raise ValueError(f"Kolom {', '.join(missing)} tidak ditemukan di {filename}")
+        indexes = [header.index(name) for name in names]
+        for number, row in enumerate(reader, 1):
+            if not row:  # baris kosong, sama seperti csv.DictReader
+                continue
+            if len(row) < len(header):
+                print(f"⚠️  Error parsing row {number}: kolom kurang ({len(row)} dari {len(header)})")
+                continue
+            yield number, {name: row[i] for name, i in zip(names, indexes)}
+
+
+def load_from_csv(filename, dedup=False, keep='rating'):
+    """
+    Memuat playlist dari file CSV/TXT
+    Jika dedup=True, lagu duplikat digabung sebelum dimasukkan ke playlist
+    """
+    import csv
+    
+    if dedup:
+        validate_keep(keep)
+    
     playlist = DoublyLinkedList()
+    winners = {}
     
     try:
         with open(filename, 'r', encoding='utf-8') as file:
@@ -455,26 +1333,24 @@ def load_from_csv(filename):
             count = 0
             for row in reader:
                 try:
-                    # Parse duration dari format MM:SS ke detik
-                    duration = parse_duration(row['Duration'])
-                    
-                    song = Song(
-                        id=str(row['ID']),
-                        title=row['Title'],
-                        artist=row['Artist'],
-                        album=row['Album'],
-                        genre=row['Genre'],
-                        duration=duration,
-                        year=int(row['Year']),
-                        rating=float(row['Rating'])
-                    )
-                    playlist.insert_last(song)
+                    song = song_from_row(row)
+                    if dedup:
+                        key = song_key(song)
+                        existing = winners.get(key)
+                        winners[key] = song if existing is None else pick_song(existing, song, keep)
+                    else:
+                        playlist.insert_last(song)
                     count += 1
                 except Exception as e:
                     print(f"⚠️  Error parsing row {count+1}: {e}")
                     continue
         
+        for song in winners.values():
+            playlist.insert_last(song)
+        
         print(f"✅ Berhasil memuat {count} lagu dari {filename}")
+        if dedup:
+            print(f"🔁 {count - playlist.size} lagu duplikat digabung")
         return playlist
     except FileNotFoundError:
         print(f"❌ File {filename} tidak ditemukan")
@@ -486,6 +1362,8 @@ def load_from_csv(filename):
 
 def save_to_csv(playlist, filename="playlist_export.csv"):
     """Menyimpan playlist ke file CSV"""
+    import csv
+    
     try:
         with open(filename, 'w', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
@@ -576,6 +1454,8 @@ class MusicPlaylistSystem:
     
     def add_song_manual(self):
         """Input manual untuk menambah lagu"""
+        from datetime import datetime
+        
         print("\n--- Tambah Lagu Baru ---")
         id = f"song_{datetime.now().strftime('%Y%m%d%H%M%S')}"
         title = input("Judul: ")
@@ -773,8 +1653,147 @@ class MusicPlaylistSystem:
             input("\nTekan Enter untuk melanjutkan...")
 
 
+# ==================== NON-INTERACTIVE CLI ====================
+SONG_COLUMNS = ['ID', 'Title', 'Artist', 'Album', 'Genre', 'Duration', 'Year', 'Rating']
+
+
+def _iter_matching_songs(filename, match):
+    """Streaming baris file, Song object hanya dibuat untuk baris yang cocok"""
+    for number, row in iter_csv_rows(filename, SONG_COLUMNS):
+        if match(row):
+            try:
+                yield song_from_row(row)
+            except ValueError as e:
+                print(f"⚠️  Error parsing row {number}: {e}")
+                continue
+
+
+def cli_search(args):
+    """Subcommand search: cari judul/artis/genre"""
+    query = args.query.lower()
+    songs = list(_iter_matching_songs(args.file, lambda row: (
+        query in row['Title'].lower() or
+        query in row['Artist'].lower() or
+        query in row['Genre'].lower())))
+    print_songs(songs, f"Hasil Pencarian: '{args.query}'", args.limit or len(songs))
+    return 0
+
+
+def cli_filter(args):
+    """Subcommand filter: filter berdasarkan genre dan/atau tahun"""
+    genre = args.genre.lower() if args.genre else None
+    year = str(args.year) if args.year is not None else None
+    songs = list(_iter_matching_songs(args.file, lambda row: (
+        (genre is None or row['Genre'].lower() == genre) and
+        (year is None or row['Year'].strip() == year))))
+    print_songs(songs, "Hasil Filter", args.limit or len(songs))
+    return 0
+
+
+def cli_stats(args):
+    """Subcommand stats: statistik dihitung streaming tanpa membuat node"""
+    total_songs = 0
+    total_duration = 0
+    total_rating = 0.0
+    
+    # Aturan validasi baris sama dengan song_from_row (Year dan Rating harus angka)
+    for number, row in iter_csv_rows(args.file, ['Duration', 'Year', 'Rating']):
+        try:
+            int(row['Year'])
+            rating = float(row['Rating'])
+        except ValueError as e:
+            print(f"⚠️  Error parsing row {number}: {e}")
+            continue
+        total_songs += 1
+        total_duration += parse_duration(row['Duration'])
+        total_rating += rating
+    
+    print(f"Total Lagu       : {total_songs}")
+    print(f"Total Durasi     : {format_duration(total_duration)} ({total_duration} detik)")
+    print(f"Rata-rata Durasi : {format_duration(total_duration // total_songs if total_songs > 0 else 0)}")
+    print(f"Rata-rata Rating : {total_rating / total_songs if total_songs > 0 else 0:.2f}")
+    return 0
+
+
+def cli_export(args):
+    """Subcommand export: tulis ulang (opsional difilter/dedup) ke CSV"""
+    genre = args.genre.lower() if args.genre else None
+    songs = _iter_matching_songs(args.file, lambda row: (
+        genre is None or row['Genre'].lower() == genre))
+    if args.dedup:
+        songs = deduplicate_songs(songs)
+    
+    playlist = DoublyLinkedList()
+    for song in songs:
+        playlist.insert_last(song)
+    return 0 if save_to_csv(playlist, args.output) else 1
+
+
+def cli_convert(args):
+    """Subcommand convert: konversi TXT ke CSV"""
+    return 0 if convert_txt_to_csv(args.input, args.output) else 1
+
+
+def main(argv=None):
+    """
+    Entry point CLI non-interaktif
+    Contoh: python fileuas.py stats --file datasetuas.csv
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Sistem Manajemen Playlist Musik")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    def add_file_arg(sub):
+        sub.add_argument('--file', default="DATASETUAS.txt", help="file dataset CSV/TXT")
+    
+    search = subparsers.add_parser('search', help="cari lagu berdasarkan judul/artis/genre")
+    search.add_argument('query')
+    search.add_argument('--limit', type=int, default=20, help="0 = tampilkan semua")
+    add_file_arg(search)
+    search.set_defaults(func=cli_search)
+    
+    filter_ = subparsers.add_parser('filter', help="filter lagu berdasarkan genre/tahun")
+    filter_.add_argument('--genre')
+    filter_.add_argument('--year', type=int)
+    filter_.add_argument('--limit', type=int, default=20, help="0 = tampilkan semua")
+    add_file_arg(filter_)
+    filter_.set_defaults(func=cli_filter)
+    
+    stats = subparsers.add_parser('stats', help="statistik dataset")
+    add_file_arg(stats)
+    stats.set_defaults(func=cli_stats)
+    
+    export = subparsers.add_parser('export', help="export dataset ke CSV")
+    export.add_argument('--output', default="playlist_export.csv")
+    export.add_argument('--genre')
+    export.add_argument('--dedup', action='store_true', help="gabungkan lagu duplikat")
+    add_file_arg(export)
+    export.set_defaults(func=cli_export)
+    
+    convert = subparsers.add_parser('convert', help="konversi TXT ke CSV")
+    convert.add_argument('--input', default="DATASETUAS.txt")
+    convert.add_argument('--output', default="DATASETUAS.csv")
+    convert.set_defaults(func=cli_convert)
+    
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except FileNotFoundError as e:
+        print(f"❌ File {e.filename} tidak ditemukan")
+        return 1
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+
 # ==================== MAIN PROGRAM ====================
 if __name__ == "__main__":
+    import sys
+    
+    if len(sys.argv) > 1:
+        sys.exit(main())
+    
     system = MusicPlaylistSystem()
     system.run()
 
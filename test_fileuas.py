@@ -0,0 +1,315 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from fileuas import (DoublyLinkedList, ListeningSession, Song, deduplicate_songs,
+                     load_from_csv, main, normalize_text, pick_song, song_key)
+
+
+def build(rows):
+    """Membuat playlist dari list (artist, duration, rating)"""
+    playlist = DoublyLinkedList()
+    for i, (artist, duration, rating) in enumerate(rows):
+        playlist.insert_last(Song(str(i), f"Song {i}", artist, "Album", "Pop",
+                                  duration, 2000, rating))
+    return playlist
+
+
+def brute_force_feasible(rows, target, tolerance, max_per_artist):
+    """Cek semua subset apakah ada yang masuk toleransi dan batas artis"""
+    for size in range(1, len(rows) + 1):
+        for subset in combinations(rows, size):
+            total = sum(duration for _, duration, _ in subset)
+            artists = [artist for artist, _, _ in subset]
+            if (abs(total - target) <= tolerance and
+                    (max_per_artist is None or
+                     all(artists.count(a) <= max_per_artist for a in artists))):
+                return True
+    return False
+
+
+def test_timed_playlist_artist_cap_uses_lower_rated_song():
+    playlist = build([('A', 25, 5.0), ('A', 10, 4.0), ('B', 30, 3.0)])
+
+    result = playlist.generate_timed_playlist(40, tolerance=0, max_per_artist=1)
+
+    assert result is not None
+    assert result.get_total_duration() == 40
+    assert sorted(song.artist for song in result.display_forward()) == ['A', 'B']
+
+
+def test_timed_playlist_matches_brute_force():
+    rng = random.Random(0)
+
+    for _ in range(300):
+        rows = [(rng.choice('ABC'), rng.randint(5, 40), rng.choice([3.0, 4.0, 5.0]))
+                for _ in range(rng.randint(1, 7))]
+        target = rng.randint(10, 100)
+        tolerance = rng.randint(0, 3)
+        max_per_artist = rng.choice([None, 1, 2, 3])
+
+        result = build(rows).generate_timed_playlist(
+            target, tolerance=tolerance, max_per_artist=max_per_artist)
+
+        assert (result is not None) == brute_force_feasible(
+            rows, target, tolerance, max_per_artist)
+        if result is not None:
+            songs = result.display_forward()
+            artists = [song.artist for song in songs]
+            assert abs(result.get_total_duration() - target) <= tolerance
+            assert ids(songs) == sorted(ids(songs), key=int)
+            if max_per_artist is not None:
+                assert all(artists.count(a) <= max_per_artist for a in artists)
+
+
+def test_timed_playlist_rejects_invalid_input():
+    playlist = build([('A', 25, 5.0), ('B', 30, 4.0)])
+
+    with pytest.raises(ValueError):
+        playlist.generate_timed_playlist(-10)
+    with pytest.raises(ValueError):
+        playlist.generate_timed_playlist(60, tolerance=-1)
+    with pytest.raises(ValueError):
+        playlist.generate_timed_playlist(60, max_per_artist=0)
+
+    playlist.update('0', duration=25.5)
+    with pytest.raises(ValueError):
+        playlist.generate_timed_playlist(60)
+
+
+def make_song(id, title="Song", artist="Artist", genre="Pop", year=2000):
+    return Song(id, title, artist, "Album", genre, 180, year, 4.0)
+
+
+def ids(songs):
+    return [s.id for s in songs]
+
+
+def test_cache_patched_on_insert_and_delete():
+    playlist = DoublyLinkedList()
+    playlist.insert_last(make_song('1', "Pop Song"))
+    playlist.insert_last(make_song('2', "Rock Song", genre="Rock"))
+    assert ids(playlist.search('pop')) == ['1']
+
+    playlist.insert_first(make_song('0', "Pop Intro"))
+    playlist.insert_last(make_song('3', "Pop Outro"))
+    playlist.insert_last(make_song('4', "Jazz", genre="Jazz"))
+    assert ids(playlist.search('pop')) == ['0', '1', '3']
+
+    playlist.delete_node('1')
+    assert ids(playlist.search('pop')) == ['0', '3']
+    playlist.delete_first()
+    playlist.delete_last()
+    assert ids(playlist.search('pop')) == ['3']
+    assert playlist.cache_info()['hits'] == 3
+    assert playlist.cache_info()['misses'] == 1
+
+
+def test_cache_invalidated_by_update_and_sort():
+    playlist = DoublyLinkedList()
+    playlist.insert_last(make_song('1', "B Pop"))
+    playlist.insert_last(make_song('2', "A Pop"))
+    assert ids(playlist.filter_by_genre('pop')) == ['1', '2']
+
+    playlist.update('1', rating=5.0, album="Other")
+    assert playlist.cache_info()['size'] == 1
+
+    playlist.update('1', genre="Rock")
+    assert playlist.cache_info()['size'] == 0
+    assert ids(playlist.filter_by_genre('pop')) == ['2']
+
+    playlist.update('1', genre="Pop")
+    assert ids(playlist.search('pop')) == ['1', '2']
+    playlist.sort_by_title()
+    assert playlist.cache_info()['size'] == 0
+    assert ids(playlist.search('pop')) == ['2', '1']
+
+
+def test_cache_lru_eviction_and_info():
+    playlist = DoublyLinkedList()
+    playlist.cache_capacity = 2
+    playlist.insert_last(make_song('1', year=1999))
+    playlist.insert_last(make_song('2', year=2000))
+
+    playlist.filter_by_year(1999)
+    playlist.filter_by_year(2000)
+    playlist.filter_by_year(1999)   # hit, 1999 jadi paling baru
+    playlist.search('song')         # buang 2000
+    playlist.filter_by_year(2000)   # miss lagi
+
+    info = playlist.cache_info()
+    assert info['hits'] == 1
+    assert info['misses'] == 4
+    assert info['size'] == 2
+    assert info['capacity'] == 2
+    assert ('year', 2000) in playlist._cache
+    assert ('year', 1999) not in playlist._cache
+
+
+def test_cached_results_are_copies():
+    playlist = DoublyLinkedList()
+    playlist.insert_last(make_song('1'))
+    playlist.search('song').clear()
+    assert ids(playlist.search('song')) == ['1']
+
+
+def test_session_resets_position_when_current_song_deleted():
+    playlist = DoublyLinkedList()
+    first = Song('1', "First", "A", "Album", "Pop", 240, 2000, 4.0)
+    second = Song('2', "Second", "B", "Album", "Pop", 150, 2000, 4.0)
+    playlist.insert_last(first)
+    playlist.insert_last(second)
+    session = ListeningSession(playlist, history_size=10)
+
+    session.advance(200)
+    playlist.delete_node('1')
+
+    assert session.advance(10) is second
+    assert session.resume_point() == (second, 10)
+    assert session.recently_played() == ['2', '1']
+    assert session.get_play_count('2') == 1
+
+
+def test_session_rejects_empty_history():
+    with pytest.raises(ValueError):
+        ListeningSession(DoublyLinkedList(), history_size=0)
+
+
+def test_normalize_text_matches_case_accents_and_punctuation():
+    assert normalize_text("  Héllo,  WORLD! ") == "hello world"
+    assert song_key(Song('1', "Café-Del Mar", "Sheila On 7", "", "", 1, 2000)) == \
+        song_key(Song('2', "cafe del mar", "SHEILA ON 7", "", "", 1, 2000))
+
+
+def test_keep_rules():
+    old = Song('1', "T", "A", "", "", 100, 1999, 4.0)
+    new = Song('2', "T", "A", "", "", 100, 2010, 3.0)
+
+    assert pick_song(old, new, 'rating') is old
+    assert pick_song(old, new, 'year') is new
+    assert pick_song(old, new, 'first') is old
+    assert pick_song(old, new, 'last') is new
+    assert pick_song(old, new, lambda a, b: b) is new
+    with pytest.raises(ValueError):
+        deduplicate_songs([old, new], keep='bogus')
+
+
+def test_deduplicate_keeps_winner_at_first_position():
+    playlist = DoublyLinkedList()
+    for song in [Song('1', "Sephia", "Sheila On 7", "", "", 100, 2000, 4.0),
+                 Song('2', "Other", "B", "", "", 100, 2000, 4.0),
+                 Song('3', "SEPHIA!", "sheila on 7", "", "", 100, 2000, 5.0)]:
+        playlist.insert_last(song)
+
+    assert playlist.deduplicate() == 1
+    assert ids(playlist.display_forward()) == ['3', '2']
+    assert ids(playlist.display_backward()) == ['2', '3']
+    assert playlist.size == 2
+    assert ids(deduplicate_songs([Song('1', "X", "Y", "", "", 1, 2000, 1.0),
+                                  Song('2', "x", "y", "", "", 1, 2000, 2.0)],
+                                 keep='first')) == ['1']
+
+
+def test_deduplicate_moves_current_song_off_unlinked_node():
+    playlist = DoublyLinkedList()
+    for id in ('1', '2', '3'):
+        playlist.insert_last(Song(id, "Same", "Artist", "", "", 100, 2000, 4.0))
+    playlist.play_next()
+
+    playlist.deduplicate(keep='first')
+
+    assert playlist.size == 1
+    assert playlist.get_current_song().id == '1'
+
+
+def test_load_from_csv_dedup(tmp_path):
+    path = tmp_path / "songs.csv"
+    path.write_text("ID,Title,Artist,Album,Genre,Duration,Year,Rating\n"
+                    "1,Sephia,Sheila On 7,A,Pop,4:53,2000,4.5\n"
+                    "2,Other,B,A,Pop,3:00,2000,4.0\n"
+                    "3,sephia,SHEILA ON 7,B,Pop,4:53,2000,5.0\n", encoding='utf-8')
+
+    playlist = load_from_csv(str(path), dedup=True)
+
+    assert ids(playlist.display_forward()) == ['3', '2']
+    with pytest.raises(ValueError):
+        load_from_csv(str(path), dedup=True, keep='bogus')
+
+
+def playlist_of(*song_ids):
+    playlist = DoublyLinkedList()
+    for id in song_ids:
+        playlist.insert_last(make_song(id))
+    return playlist
+
+
+def assert_linked(playlist, expected):
+    assert ids(playlist.display_forward()) == expected
+    assert ids(playlist.display_backward()) == expected[::-1]
+    assert playlist.size == len(expected)
+    if expected:
+        assert playlist.head.prev is None and playlist.tail.next is None
+        assert playlist.get_current_song() is not None
+    else:
+        assert playlist.head is None and playlist.tail is None
+        assert playlist.get_current_song() is None
+
+
+@pytest.mark.parametrize('splice', [False, True])
+def test_set_operations(splice):
+    cases = [
+        ('union', ['1', '2', '3', '4', '5', '6'], [], ['3', '4']),
+        ('intersection', ['3', '4'], ['1', '2'], ['3', '4', '5', '6']),
+        ('difference', ['1', '2'], ['3', '4'], ['3', '4', '5', '6']),
+        ('merge', ['1', '3', '2', '4', '5', '6'], ['3', '4'], []),
+    ]
+    for op, expected, left_a, left_b in cases:
+        a = playlist_of('1', '2', '3', '4')
+        b = playlist_of('3', '4', '5', '6')
+
+        result = getattr(a, op)(b, splice=splice)
+
+        assert_linked(result, expected)
+        if splice:
+            assert_linked(a, left_a)
+            assert_linked(b, left_b)
+        else:
+            assert_linked(a, ['1', '2', '3', '4'])
+            assert_linked(b, ['3', '4', '5', '6'])
+
+
+def test_splice_moves_current_song_and_leaves_duplicates():
+    a = playlist_of('1', '2', '2', '3')
+    a.play_next()
+
+    result = a.difference(playlist_of('3'), splice=True)
+
+    assert_linked(result, ['1', '2'])
+    assert_linked(a, ['2', '3'])
+
+
+def test_merge_with_itself_splice():
+    a = playlist_of('1', '2', '3')
+
+    result = a.merge(a, splice=True)
+
+    assert_linked(result, ['1', '2', '3'])
+    assert_linked(a, [])
+
+
+def test_cli_stats_warns_on_skipped_rows(tmp_path, capsys):
+    path = tmp_path / "songs.csv"
+    path.write_text("ID,Title,Artist,Album,Genre,Duration,Year,Rating\n"
+                    "1,A,B,C,Pop,3:00,2000,4.0\n"
+                    "2,Short,B\n"
+                    "3,Bad,B,C,Pop,3:00,abc,4.0\n", encoding='utf-8')
+
+    assert main(['stats', '--file', str(path)]) == 0
+    output = capsys.readouterr().out
+    assert "Total Lagu       : 1" in output
+    assert "Error parsing row 2" in output
+    assert "Error parsing row 3" in output
+
+    path.write_text("ID,Title\n1,A\n", encoding='utf-8')
+    assert main(['stats', '--file', str(path)]) == 1